@@ -19,21 +19,30 @@
 import sys
 import json
 import os
+import bisect
+import hashlib
 import re
+import queue
+import tempfile
+from itertools import accumulate
 from datetime import datetime, date
-from typing import Dict, List, Any, Optional
+from decimal import Decimal
+from typing import Callable, Dict, List, Any, Optional, Tuple
 
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                                QHBoxLayout, QPushButton, QLineEdit, QTextEdit, 
                                QLabel, QGroupBox, QScrollArea, QDateEdit, 
                                QSpinBox, QDoubleSpinBox, QMessageBox, QComboBox,
                                QDialog, QDialogButtonBox, QPlainTextEdit, 
-                               QTabWidget, QTableWidget, QTableWidgetItem, 
+                               QTabWidget, QTableView, 
                                QHeaderView, QSplitter, QCheckBox, QFormLayout,
                                QStackedWidget, QListWidget, QListWidgetItem,
-                               QToolButton, QMenu, QInputDialog, QFileDialog)
-from PySide6.QtCore import Qt, QDate, QTimer, QItemSelectionModel
-from PySide6.QtGui import QFont, QAction, QIcon
+                               QToolButton, QMenu, QInputDialog, QFileDialog,
+                               QSizePolicy)
+from PySide6.QtCore import (Qt, QDate, QTimer, QItemSelectionModel,
+                            QAbstractTableModel, QModelIndex, QObject, Signal,
+                            QRunnable, QThreadPool, QMutex, QMutexLocker)
+from PySide6.QtGui import QFont, QAction, QIcon, QTextCursor
 
 # 数据库连接相关
 try:
@@ -44,17 +53,410 @@ except ImportError:
     DB_AVAILABLE = False
     QMessageBox.warning(None, "警告", "未安装pymysql库，数据库功能将不可用\n请运行: pip install pymysql")
 
+# 可选：orjson 解析/序列化速度更快，未安装时回退到标准库 json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+class _ResultEncoder(json.JSONEncoder):
+    """查询结果JSON编码器：处理datetime、date和Decimal等数据库返回类型"""
+    
+    def default(self, obj):
+        obj_type = type(obj)
+        if obj_type is datetime or obj_type is date:
+            return obj.isoformat()
+        if obj_type is Decimal:
+            return float(obj)
+        if isinstance(obj, (datetime, date)):
+            return obj.isoformat()
+        if hasattr(obj, '__float__'):  # 处理其他可转为浮点数的类型
+            return float(obj)
+        if hasattr(obj, '__int__'):  # 处理其他数值类型
+            return int(obj)
+        return super().default(obj)
+
+
+# 复用编码器实例，避免每次序列化都重新创建
+_RESULT_ENCODER = _ResultEncoder(ensure_ascii=False)
+_RESULT_ENCODER_INDENT = _ResultEncoder(ensure_ascii=False, indent=2)
+
+# 结果区域最多显示的记录条数，超出部分只提示数量
+_RESULT_PREVIEW_ROWS = 500
+
+# 数据库连接池：按 (主机, 端口, 用户名, 密码摘要, 数据库) 复用已建立的连接
+_POOL_SIZE = 10
+_POOL: Dict[tuple, queue.Queue] = {}
+
+def _json_loads(data: bytes) -> Any:
+    """解析JSON字节串"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """序列化为带缩进的UTF-8 JSON字节串"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def _digest(data: bytes) -> bytes:
+    """文件内容摘要，用于修改时间精度不足时确认文件是否真的变化"""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _file_digest(path: str) -> bytes:
+    """读取文件并计算内容摘要"""
+    with open(path, 'rb') as f:
+        return _digest(f.read())
+
+
+# 串行化配置文件写入，避免多个保存任务同时写同一文件
+_SAVE_MUTEX = QMutex()
+
+
+def _write_file_atomic(path: str, data: bytes):
+    """先写临时文件再替换目标文件，写入中途失败不会留下半个配置文件"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.config-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class _SaveSignals(QObject):
+    """后台保存任务的结果通知"""
+    finished = Signal(bool, str)
+
+
+class _SaveTask(QRunnable):
+    """在线程池中写入配置文件"""
+    
+    def __init__(self, path: str, data: bytes):
+        super().__init__()
+        self.path = path
+        self.data = data
+        self.signals = _SaveSignals()
+        
+    def run(self):
+        try:
+            with QMutexLocker(_SAVE_MUTEX):
+                _write_file_atomic(self.path, self.data)
+        except Exception as e:
+            self.signals.finished.emit(False, str(e))
+        else:
+            self.signals.finished.emit(True, "")
+
+
+# {{字段名}} 占位符
+_PLACEHOLDER_RE = re.compile(r"\{\{([^{}]+)\}\}")
+
+
+def _render_sql(sql: str, params: Optional[Dict[str, Any]]) -> str:
+    """一次扫描替换SQL中的{{字段名}}占位符，未提供的字段保持原样"""
+    if not params:
+        return sql
+    return _PLACEHOLDER_RE.sub(
+        lambda m: str(params[m.group(1)]) if m.group(1) in params else m.group(0), sql
+    )
+
+
+# SQL语句的首个关键字
+_KEYWORD_RE = re.compile(r"\s*(\w+)")
+
+
+def _statement_keyword(sql: str) -> str:
+    """返回SQL首个关键字的大写形式（只转换首个单词，而不是整条语句）"""
+    m = _KEYWORD_RE.match(sql)
+    return m.group(1).upper() if m else ''
+
+
+# 一条SQL语句：普通字符、引号/反引号内容或注释组成的连续片段，语句之间以分号分隔
+_SQL_SPLIT_RE = re.compile(r"""
+    (?:
+        [^;'"`#/-]+                         # 普通字符
+      | '(?:[^'\\]|\\.)*'?                  # 单引号字符串（允许未闭合）
+      | "(?:[^"\\]|\\.)*"?                  # 双引号字符串
+      | `[^`]*`?                            # 反引号标识符
+      | \#[^\n]*                            # # 行注释
+      | --(?=[ \t\r\n]|$)[^\n]*             # -- 行注释（后面必须是空白或结尾）
+      | /\*.*?(?:\*/|\Z)                    # 块注释
+      | [/-]                                # 单独的 / 或 -
+    )+
+""", re.VERBOSE | re.DOTALL)
+
+
+def _split_sql(sql: str):
+    """按分号拆分多条SQL语句（逐个生成），忽略引号、反引号和注释中的分号"""
+    for m in _SQL_SPLIT_RE.finditer(sql):
+        stmt = m.group(0).strip()
+        if stmt:
+            yield stmt
+
+
+# 单行 INSERT INTO 表 (列...) VALUES 语句头
+_INSERT_RE = re.compile(r"\s*INSERT\s+INTO\s+(\S+)\s*\(([^)]*)\)\s*VALUES\s*", re.IGNORECASE)
+# 合并后单条INSERT语句的最大长度（字符数），需小于服务器 max_allowed_packet
+_INSERT_BATCH_CHARS = 1 << 20
+# 引号、双引号和反引号内的内容
+_QUOTED_RE = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|`[^`]*`", re.DOTALL)
+# 依赖逐条执行结果的函数或变量（会话变量、@@IDENTITY），脚本中出现时不合并INSERT
+_MERGE_BLOCKER_RE = re.compile(r"\bLAST_INSERT_ID\b|\bROW_COUNT\b|@", re.IGNORECASE)
+
+
+def _literal_values_row(values: str) -> bool:
+    """判断VALUES之后是否恰好是一个只含字面量的括号元组
+
+    元组内出现函数调用或子查询（嵌套括号）时返回False，这类值可能依赖前面语句
+    的执行结果，合并后结果会不同。多行值或ON DUPLICATE等子句同样返回False。
+    """
+    if not values.startswith('('):
+        return False
+    depth = 0
+    quote = None
+    i = 0
+    n = len(values)
+    while i < n:
+        c = values[i]
+        if quote:
+            if c == '\\':
+                i += 1
+            elif c == quote:
+                quote = None
+        elif c in "'\"`":
+            quote = c
+        elif c == '(':
+            if depth:
+                return False
+            depth += 1
+        elif c == ')':
+            depth -= 1
+            if depth == 0:
+                return not values[i + 1:].strip()
+        i += 1
+    return False
+
+
+def _merge_blocked(statements: List[tuple]) -> bool:
+    """脚本中是否有语句读取逐条执行的结果（LAST_INSERT_ID、ROW_COUNT、会话变量等）
+
+    多行INSERT的 LAST_INSERT_ID() 返回第一行的自增ID，ROW_COUNT() 返回全部行数，
+    合并后后续语句读到的值会改变，因此出现时整个脚本都不合并。
+    """
+    return any(_MERGE_BLOCKER_RE.search(_QUOTED_RE.sub('', sql)) for _, sql in statements)
+
+
+def _merge_inserts(statements: List[tuple]) -> List[tuple]:
+    """将连续的同表同列、只含字面量的单行INSERT合并为多行VALUES语句，减少数据库往返
+
+    statements 为 (语句序号, SQL) 列表，返回 (起始序号, 结束序号, SQL) 列表，
+    未合并的语句起始和结束序号相同。
+    """
+    if _merge_blocked(statements):
+        return [(index, index, sql) for index, sql in statements]
+        
+    merged = []
+    batch = None  # 当前正在合并的 [起始序号, 结束序号, 语句头, VALUES元组列表, 长度]
+    batch_key = None
+    
+    for index, sql in statements:
+        m = _INSERT_RE.match(sql)
+        values = sql[m.end():].rstrip() if m else ''
+        if not m or not _literal_values_row(values):
+            batch = batch_key = None
+            merged.append((index, index, sql))
+            continue
+            
+        key = (m.group(1), ''.join(m.group(2).split()))
+        if key == batch_key and batch[4] + len(values) + 1 <= _INSERT_BATCH_CHARS:
+            batch[1] = index
+            batch[3].append(values)
+            batch[4] += len(values) + 1
+            continue
+            
+        batch_key = key
+        batch = [index, index, sql[:m.end()].strip() + ' ', [values], len(sql)]
+        merged.append(batch)
+        
+    return [(item[0], item[1], item[2] + ','.join(item[3])) if isinstance(item, list) else item
+            for item in merged]
+
+
+class ElidedLabel(QLabel):
+    """单行纯文本标签，宽度不足时在末尾显示省略号，不会撑大所在的布局"""
+    
+    def __init__(self, text: str, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self._full_text = text
+        self.setTextFormat(Qt.PlainText)  # SQL中的 a<b 等不能按HTML解析
+        self.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Preferred)
+        self.setMinimumWidth(0)
+        self.setText(text)  # 显示前的占位，首次调整大小时按实际宽度截断
+        
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.setText(self.fontMetrics().elidedText(self._full_text, Qt.ElideRight, self.contentsRect().width()))
+
+
+class FieldsModel(QAbstractTableModel):
+    """字段配置表格模型（直接持有字段字典列表，避免逐单元格创建表格项）"""
+    
+    HEADERS = ["字段标签", "类型", "占位符", "选项"]
+    KEYS = ["label", "type", "placeholder", "options"]
+    DEFAULT_FIELD = {"label": "新字段", "type": "text", "placeholder": "请输入值"}
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Dict[str, Any]] = []
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.KEYS)
+        
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        field = self._rows[index.row()]
+        key = self.KEYS[index.column()]
+        if key == 'options':
+            return ','.join(field.get('options') or [])
+        if key == 'type':
+            return field.get('type', 'text')
+        return field.get(key, '')
+        
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        field = self._rows[index.row()]
+        key = self.KEYS[index.column()]
+        text = str(value)
+        if key == 'options':
+            options = [opt.strip() for opt in text.split(',') if opt.strip()]
+            if options:
+                field['options'] = options
+            else:
+                field.pop('options', None)
+        else:
+            field[key] = text
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+        
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+        
+    def insertRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or row < 0 or row > len(self._rows):
+            return False
+        self.beginInsertRows(parent, row, row + count - 1)
+        self._rows[row:row] = [dict(self.DEFAULT_FIELD) for _ in range(count)]
+        self.endInsertRows()
+        return True
+        
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or row < 0 or row + count > len(self._rows):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._rows[row:row + count]
+        self.endRemoveRows()
+        return True
+        
+    def moveRows(self, source_parent, source_row, count, destination_parent, destination_child):
+        if source_parent.isValid() or destination_parent.isValid():
+            return False
+        if source_row < 0 or source_row + count > len(self._rows):
+            return False
+        if source_row <= destination_child <= source_row + count:
+            return False
+        if not self.beginMoveRows(source_parent, source_row, source_row + count - 1,
+                                  destination_parent, destination_child):
+            return False
+        moved = self._rows[source_row:source_row + count]
+        del self._rows[source_row:source_row + count]
+        if destination_child > source_row:
+            destination_child -= count
+        self._rows[destination_child:destination_child] = moved
+        self.endMoveRows()
+        return True
+        
+    def fields(self) -> List[Dict[str, Any]]:
+        """导出字段配置（选项在编辑时已解析为列表，这里无需再逐格读取）"""
+        result = []
+        for row in self._rows:
+            field = {
+                "label": row.get('label', ''),
+                "type": row.get('type', 'text'),
+                "placeholder": row.get('placeholder', '')
+            }
+            if row.get('options'):
+                field['options'] = list(row['options'])
+            result.append(field)
+        return result
+        
+    def set_fields(self, fields: List[Dict[str, Any]]):
+        """替换字段数据：只插入/删除行数差额，已有行原地更新，避免整表重置"""
+        new_rows = [dict(field) for field in fields]
+        old_count = len(self._rows)
+        new_count = len(new_rows)
+        
+        if new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            self._rows.extend(new_rows[old_count:])
+            self.endInsertRows()
+        elif new_count < old_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            del self._rows[new_count:]
+            self.endRemoveRows()
+            
+        common = min(old_count, new_count)
+        if common:
+            self._rows[:common] = new_rows[:common]
+            self.dataChanged.emit(self.index(0, 0), self.index(common - 1, len(self.KEYS) - 1))
+
 
 class SmartConfigDialog(QDialog):
     """界面配置管理对话框"""
     
+    # 延迟创建的标签页下标
+    FIELDS_TAB = 1
+    DATABASE_TAB = 2
+    
     def __init__(self, config_path, parent=None):
         super().__init__(parent)
         self.config_path = config_path
         self.config = None
+        self._db_config = {}
         self.current_query_index = -1
         self.current_field_index = -1
         
+        # 配置文件写入线程池（单线程，保证保存顺序）
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+        
         self.init_ui()
         self.load_config()
         
@@ -96,17 +498,27 @@ class SmartConfigDialog(QDialog):
         right_widget = QWidget()
         right_layout = QVBoxLayout(right_widget)
         
+        # 字段数据由模型保存，表格视图随字段配置页延迟创建
+        self.fields_model = FieldsModel(self)
+        self.fields_model.dataChanged.connect(self.on_field_changed)
+        
         # 创建标签页
         self.tab_widget = QTabWidget()
 
-        # 查询配置页
-        self.create_query_config_tab()
-
-        # 字段配置页
-        self.create_fields_tab()
+        # 查询配置页（默认显示，立即创建）
+        self.tab_widget.addTab(self.create_query_config_tab(), "🔍 查询配置")
 
-        # 数据库配置页
-        self.create_database_tab()
+        # 字段配置页和数据库配置页先放置占位控件，首次切换到时再创建
+        self._tab_builders = {
+            self.FIELDS_TAB: self.create_fields_tab,
+            self.DATABASE_TAB: self.create_database_tab,
+        }
+        self._built_tabs = {0}
+        for label in ("📝 字段配置", "🏠 数据库配置"):
+            placeholder = QWidget()
+            QVBoxLayout(placeholder).setContentsMargins(0, 0, 0, 0)
+            self.tab_widget.addTab(placeholder, label)
+        self.tab_widget.currentChanged.connect(self.ensure_tab_built)
         
         right_layout.addWidget(self.tab_widget)
         
@@ -138,6 +550,18 @@ class SmartConfigDialog(QDialog):
         
         layout.addWidget(main_splitter)
         
+    def ensure_tab_built(self, index):
+        """首次显示标签页时创建其内容"""
+        if index in self._built_tabs or index not in self._tab_builders:
+            return
+        self._built_tabs.add(index)
+        
+        content = self._tab_builders[index]()
+        self.tab_widget.widget(index).layout().addWidget(content)
+        
+        if index == self.DATABASE_TAB:
+            self.load_database_config()
+        
     def create_database_tab(self):
         """创建数据库配置标签页"""
         db_widget = QWidget()
@@ -161,7 +585,7 @@ class SmartConfigDialog(QDialog):
         db_layout.addRow("密码:", self.db_password)
         db_layout.addRow("数据库名:", self.db_database)
         
-        self.tab_widget.addTab(db_widget, "🏠 数据库配置")
+        return db_widget
         
     def create_query_config_tab(self):
         """创建查询配置标签页"""
@@ -208,7 +632,7 @@ class SmartConfigDialog(QDialog):
         query_layout.addWidget(basic_group)
         query_layout.addWidget(sql_group)
         
-        self.tab_widget.addTab(query_widget, "🔍 查询配置")
+        return query_widget
         
     def create_fields_tab(self):
         """创建字段配置标签页"""
@@ -237,23 +661,22 @@ class SmartConfigDialog(QDialog):
         fields_toolbar.addStretch()
         
         # 字段表格
-        self.fields_table = QTableWidget()
-        self.fields_table.setColumnCount(4)
-        self.fields_table.setHorizontalHeaderLabels(["字段标签", "类型", "占位符", "选项"])
+        self.fields_table = QTableView()
+        self.fields_table.setModel(self.fields_model)
         self.fields_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.fields_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.fields_table.itemChanged.connect(self.on_field_changed)
+        self.fields_table.setSelectionBehavior(QTableView.SelectRows)
         
         fields_layout.addLayout(fields_toolbar)
         fields_layout.addWidget(self.fields_table)
         
-        self.tab_widget.addTab(fields_widget, "📝 字段配置")
+        return fields_widget
         
     def load_config(self):
         """加载配置文件"""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config = json.load(f)
+            with open(self.config_path, 'rb') as f:
+                self.config = _json_loads(f.read())
+            self._db_config = self.config.get('database', {})
                 
             self.refresh_query_list()
             self.load_database_config()
@@ -277,23 +700,32 @@ class SmartConfigDialog(QDialog):
         
     def refresh_query_list(self):
         """刷新查询列表"""
-        self.query_list.clear()
-        
-        if not self.config or 'queries' not in self.config:
-            return
+        # 批量重建期间关闭重绘和信号，避免逐项触发布局和选择变化
+        self.query_list.setUpdatesEnabled(False)
+        self.query_list.blockSignals(True)
+        try:
+            self.query_list.clear()
             
-        for index, query in enumerate(self.config['queries']):
-            name = query.get('name', f'查询 {index + 1}')
-            item = QListWidgetItem(name)
-            item.setData(Qt.UserRole, index)
-            self.query_list.addItem(item)
+            if self.config and 'queries' in self.config:
+                for index, query in enumerate(self.config['queries']):
+                    name = query.get('name', f'查询 {index + 1}')
+                    item = QListWidgetItem(name)
+                    item.setData(Qt.UserRole, index)
+                    self.query_list.addItem(item)
+        finally:
+            self.query_list.blockSignals(False)
+            self.query_list.setUpdatesEnabled(True)
+            
+        # 信号被屏蔽期间的选择变化需要手动同步
+        if self.query_list.currentRow() != self.current_query_index:
+            self.on_query_selection_changed(self.query_list.currentRow())
             
     def load_database_config(self):
         """加载数据库配置"""
-        if not self.config:
+        if not self.config or self.DATABASE_TAB not in self._built_tabs:
             return
             
-        db_config = self.config.get('database', {})
+        db_config = self._db_config
         self.db_host.setText(db_config.get('host', 'localhost'))
         self.db_port.setValue(db_config.get('port', 3306))
         self.db_username.setText(db_config.get('username', 'root'))
@@ -333,33 +765,19 @@ class SmartConfigDialog(QDialog):
         self.query_description.clear()
         self.query_bubble_description.clear()
         self.sql_text.clear()
-        self.fields_table.setRowCount(0)
+        self.fields_model.set_fields([])
         
     def load_fields_config(self, fields):
         """加载字段配置到表格"""
-        self.fields_table.setRowCount(0)
-        
-        for field in fields:
-            row = self.fields_table.rowCount()
-            self.fields_table.insertRow(row)
-            
-            # 字段标签
-            label_item = QTableWidgetItem(field.get('label', ''))
-            self.fields_table.setItem(row, 0, label_item)
-            
-            # 字段类型
-            type_item = QTableWidgetItem(field.get('type', 'text'))
-            self.fields_table.setItem(row, 1, type_item)
-            
-            # 占位符
-            placeholder_item = QTableWidgetItem(field.get('placeholder', ''))
-            self.fields_table.setItem(row, 2, placeholder_item)
-            
-            # 选项（用于select类型）
-            options = field.get('options', [])
-            options_text = ','.join(options) if options else ''
-            options_item = QTableWidgetItem(options_text)
-            self.fields_table.setItem(row, 3, options_item)
+        # 批量加载不是用户编辑，加载期间断开字段变化的处理
+        try:
+            self.fields_model.dataChanged.disconnect(self.on_field_changed)
+        except (TypeError, RuntimeError):
+            pass
+        try:
+            self.fields_model.set_fields(fields)
+        finally:
+            self.fields_model.dataChanged.connect(self.on_field_changed)
             
     def add_new_query(self):
         """添加新查询"""
@@ -378,10 +796,14 @@ class SmartConfigDialog(QDialog):
             self.config['queries'] = []
             
         self.config['queries'].append(new_query)
-        self.refresh_query_list()
         
-        # 选中新添加的查询
+        # 只追加一项，不重建整个列表
         new_index = len(self.config['queries']) - 1
+        item = QListWidgetItem(new_query['name'])
+        item.setData(Qt.UserRole, new_index)
+        self.query_list.addItem(item)
+        
+        # 选中新添加的查询
         self.query_list.setCurrentRow(new_index)
         
     def remove_current_query(self):
@@ -390,8 +812,20 @@ class SmartConfigDialog(QDialog):
             reply = QMessageBox.question(self, "确认删除", 
                                        f"确定要删除查询 '{self.query_name.text()}' 吗？")
             if reply == QMessageBox.Yes:
-                del self.config['queries'][self.current_query_index]
-                self.refresh_query_list()
+                index = self.current_query_index
+                del self.config['queries'][index]
+                
+                # 只移除对应项，屏蔽信号避免移除过程中加载相邻查询
+                self.query_list.blockSignals(True)
+                try:
+                    self.query_list.takeItem(index)
+                    for row in range(index, self.query_list.count()):
+                        self.query_list.item(row).setData(Qt.UserRole, row)
+                    self.query_list.setCurrentRow(-1)
+                finally:
+                    self.query_list.blockSignals(False)
+                    
+                self.current_query_index = -1
                 self.clear_query_config()
                 
     def add_new_field(self):
@@ -400,44 +834,35 @@ class SmartConfigDialog(QDialog):
             QMessageBox.warning(self, "警告", "请先选择一个查询")
             return
             
-        row = self.fields_table.rowCount()
-        self.fields_table.insertRow(row)
-        
-        # 设置默认值
-        self.fields_table.setItem(row, 0, QTableWidgetItem("新字段"))
-        self.fields_table.setItem(row, 1, QTableWidgetItem("text"))
-        self.fields_table.setItem(row, 2, QTableWidgetItem("请输入值"))
-        self.fields_table.setItem(row, 3, QTableWidgetItem(""))
+        # 新增行使用模型中的默认值
+        self.fields_model.insertRows(self.fields_model.rowCount(), 1)
         
     def remove_current_field(self):
         """删除当前字段"""
-        current_row = self.fields_table.currentRow()
+        current_row = self.fields_table.currentIndex().row()
         if current_row >= 0:
-            self.fields_table.removeRow(current_row)
+            self.fields_model.removeRows(current_row, 1)
             
     def move_field_up(self):
         """上移字段"""
-        current_row = self.fields_table.currentRow()
+        current_row = self.fields_table.currentIndex().row()
         if current_row > 0:
             self.swap_fields(current_row, current_row - 1)
-            self.fields_table.setCurrentCell(current_row - 1, 0)
+            self.fields_table.setCurrentIndex(self.fields_model.index(current_row - 1, 0))
             
     def move_field_down(self):
         """下移字段"""
-        current_row = self.fields_table.currentRow()
-        if current_row < self.fields_table.rowCount() - 1:
+        current_row = self.fields_table.currentIndex().row()
+        if 0 <= current_row < self.fields_model.rowCount() - 1:
             self.swap_fields(current_row, current_row + 1)
-            self.fields_table.setCurrentCell(current_row + 1, 0)
+            self.fields_table.setCurrentIndex(self.fields_model.index(current_row + 1, 0))
             
     def swap_fields(self, row1, row2):
-        """交换两行字段"""
-        for col in range(self.fields_table.columnCount()):
-            item1 = self.fields_table.takeItem(row1, col)
-            item2 = self.fields_table.takeItem(row2, col)
-            self.fields_table.setItem(row1, col, item2)
-            self.fields_table.setItem(row2, col, item1)
-            
-    def on_field_changed(self, item):
+        """交换相邻两行字段"""
+        upper, lower = sorted((row1, row2))
+        self.fields_model.moveRow(QModelIndex(), lower, QModelIndex(), upper)
+            
+    def on_field_changed(self, top_left, bottom_right, roles=None):
         """字段改变时的处理"""
         # 可以在这里添加实时验证
         pass
@@ -454,20 +879,26 @@ class SmartConfigDialog(QDialog):
         """清空SQL语句"""
         self.sql_text.clear()
         
-    def save_config(self):
-        """保存配置到文件"""
+    def save_config(self, background: bool = False):
+        """保存配置到文件
+
+        background 为 True 时序列化在界面线程完成，文件写入交给后台线程，
+        写入结果通过 on_background_save_finished 通知。
+        """
         try:
             # 更新数据库配置
             if not self.config:
                 self.config = self.get_default_config()
                 
-            self.config['database'] = {
-                "host": self.db_host.text(),
-                "port": self.db_port.value(),
-                "username": self.db_username.text(),
-                "password": self.db_password.text(),
-                "database": self.db_database.text()
-            }
+            # 数据库配置页未打开过时，保留原有的数据库配置
+            if self.DATABASE_TAB in self._built_tabs:
+                self.config['database'] = self._db_config = {
+                    "host": self.db_host.text(),
+                    "port": self.db_port.value(),
+                    "username": self.db_username.text(),
+                    "password": self.db_password.text(),
+                    "database": self.db_database.text()
+                }
             
             # 更新当前查询配置
             if self.current_query_index >= 0 and 'queries' in self.config:
@@ -493,26 +924,19 @@ class SmartConfigDialog(QDialog):
                 
                     
                 # 处理字段配置
-                fields = []
-                for row in range(self.fields_table.rowCount()):
-                    field = {
-                        "label": self.fields_table.item(row, 0).text() if self.fields_table.item(row, 0) else "",
-                        "type": self.fields_table.item(row, 1).text() if self.fields_table.item(row, 1) else "text",
-                        "placeholder": self.fields_table.item(row, 2).text() if self.fields_table.item(row, 2) else ""
-                    }
-                    
-                    # 处理选项
-                    options_text = self.fields_table.item(row, 3).text() if self.fields_table.item(row, 3) else ""
-                    if options_text:
-                        field['options'] = [opt.strip() for opt in options_text.split(',') if opt.strip()]
-                        
-                    fields.append(field)
-                    
-                query['input_fields'] = fields
+                query['input_fields'] = self.fields_model.fields()
             
             # 保存到文件
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, ensure_ascii=False, indent=2)
+            data = _json_dumps(self.config)
+            if background:
+                task = _SaveTask(self.config_path, data)
+                task.signals.finished.connect(self.on_background_save_finished)
+                self._save_pool.start(task)
+            else:
+                # 等待尚未完成的后台保存，避免旧内容覆盖新内容
+                self._save_pool.waitForDone()
+                with QMutexLocker(_SAVE_MUTEX):
+                    _write_file_atomic(self.config_path, data)
             
             # 添加：更新左侧列表显示
             if self.current_query_index >= 0 and self.current_query_index < self.query_list.count():
@@ -528,8 +952,14 @@ class SmartConfigDialog(QDialog):
             
     def apply_changes(self):
         """应用更改但不关闭窗口"""
-        if self.save_config():
+        self.save_config(background=True)
+            
+    def on_background_save_finished(self, success: bool, error: str):
+        """后台保存完成时的处理"""
+        if success:
             QMessageBox.information(self, "成功", "配置已保存！")
+        else:
+            QMessageBox.critical(self, "错误", f"保存配置文件失败: {error}")
             
     def save_and_close(self):
         """保存并关闭窗口"""
@@ -592,13 +1022,14 @@ class ConfigEditorDialog(QDialog):
     def save_config(self):
         """保存编辑后的配置"""
         try:
-            # 验证JSON格式
+            # 解析一次：既验证JSON格式，又直接用于生成规范格式的文件内容
             content = self.config_text.toPlainText()
-            json.loads(content)  # 验证JSON格式
+            config = _json_loads(content.encode('utf-8'))
             
-            # 保存到文件
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # 保存到文件（与界面配置的保存任务串行，写入失败不会留下半个配置文件）
+            data = _json_dumps(config)
+            with QMutexLocker(_SAVE_MUTEX):
+                _write_file_atomic(self.config_path, data)
                 
             QMessageBox.information(self, "成功", "配置文件已保存！")
             self.accept()
@@ -614,58 +1045,108 @@ class DatabaseConnection:
     
     def __init__(self, config: Dict[str, Any]):
         self.config = config
+        self._db_config = config.get('database', {})
         self.connection = None
+        self._cursor = None
+        self._pool_key = None
+        self._reusable = True
         
     def connect(self) -> bool:
-        """建立数据库连接"""
+        """建立数据库连接（优先从连接池中复用）"""
         try:
             if not DB_AVAILABLE:
                 raise ImportError("pymysql库未安装")
                 
-            db_config = self.config.get('database', {})
-            self.connection = pymysql.connect(
-                host=db_config.get('host', 'localhost'),
-                port=db_config.get('port', 3306),
-                user=db_config.get('username', 'root'),
-                password=db_config.get('password', ''),
-                database=db_config.get('database', 'test'),
-                charset='utf8mb4',
-                cursorclass=pymysql.cursors.DictCursor
+            db_config = self._db_config
+            self._pool_key = (
+                db_config.get('host', 'localhost'),
+                db_config.get('port', 3306),
+                db_config.get('username', 'root'),
+                # 密码变化后不能复用旧连接，否则新密码未经验证就显示连接成功
+                hashlib.sha256(str(db_config.get('password', '')).encode('utf-8')).hexdigest(),
+                db_config.get('database', 'test')
             )
+            pool = _POOL.setdefault(self._pool_key, queue.Queue(maxsize=_POOL_SIZE))
+            
+            self.connection = None
+            while self.connection is None:
+                try:
+                    conn = pool.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    # 复用前检测连接是否可用，断开时自动重连
+                    conn.ping(reconnect=True)
+                    self.connection = conn
+                except Exception:
+                    self._discard(conn)
+                    
+            if self.connection is None:
+                self.connection = pymysql.connect(
+                    host=db_config.get('host', 'localhost'),
+                    port=db_config.get('port', 3306),
+                    user=db_config.get('username', 'root'),
+                    password=db_config.get('password', ''),
+                    database=db_config.get('database', 'test'),
+                    charset='utf8mb4',
+                    cursorclass=pymysql.cursors.DictCursor
+                )
+            # 复用同一个游标，避免每次执行都创建和销毁游标
+            self._cursor = self.connection.cursor()
+            self._reusable = True
             return True
         except Exception as e:
             return False
             
-    def execute_query(self, sql: str, params: tuple = None) -> List[Dict[str, Any]]:
+    def _close_cursor(self):
+        """关闭当前游标，忽略关闭过程中的异常"""
+        if self._cursor is not None:
+            try:
+                self._cursor.close()
+            except Exception:
+                pass
+            self._cursor = None
+            
+    def _reset_cursor(self):
+        """出错后丢弃当前游标并重新创建"""
+        self._close_cursor()
+        if self.connection:
+            self._cursor = self.connection.cursor()
+            
+    def execute_query(self, sql: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """执行单条SQL查询并返回结果"""
         if not self.connection:
             raise ConnectionError("数据库未连接")
             
+        sql = _render_sql(sql, params)
+        
         try:
-            with self.connection.cursor() as cursor:   
-                # 开始事务
-                self.connection.begin() 
-                cursor.execute(sql)
-                
-                # 判断SQL类型
-                sql_upper = sql.strip().upper()
-                
-                if sql_upper.startswith('SELECT'):
-                    # SELECT查询返回结果集
-                    results = cursor.fetchall()
-                    return results if results else []
-                elif sql_upper.startswith(('INSERT', 'UPDATE', 'DELETE')):
-                    # 增删改操作 - 必须提交事务
-                    self.connection.commit()
-                    return [{"affected_rows": cursor.rowcount, "success": True}]
-                else:
-                    # 其他SQL语句 - 也需要提交事务
-                    self.connection.commit()
-                    return [{"affected_rows": cursor.rowcount, "success": True}]
+            cursor = self._cursor
+            # 开始事务
+            self.connection.begin() 
+            cursor.execute(sql)
+            
+            # 判断SQL类型
+            keyword = _statement_keyword(sql)
+            
+            if keyword == 'SELECT':
+                # SELECT查询返回结果集
+                results = cursor.fetchall()
+                return results if results else []
+            elif keyword in ('INSERT', 'UPDATE', 'DELETE'):
+                # 增删改操作 - 必须提交事务
+                self.connection.commit()
+                return [{"affected_rows": cursor.rowcount, "success": True}]
+            else:
+                # 其他SQL语句 - 也需要提交事务
+                self.connection.commit()
+                return [{"affected_rows": cursor.rowcount, "success": True}]
         except Exception as e:
-            # 发生错误时回滚
+            # 发生错误时回滚，该连接关闭时不再放回连接池
+            self._reusable = False
             if self.connection:
                 self.connection.rollback()
+                self._reset_cursor()
             raise e
 
     def execute_multiple_queries(self, sql_statements: List[str], params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
@@ -675,64 +1156,98 @@ class DatabaseConnection:
             
         results = []
         
+        # 事务开始前完成语句预处理，缩短事务持有锁的时间：
+        # 去除空语句、替换占位符、将连续的单行INSERT合并为一条多行INSERT
+        statements = [(index, _render_sql(sql, params))
+                      for index, sql in enumerate((stmt.strip() for stmt in sql_statements), 1) if sql]
+        statements = _merge_inserts(statements)
+        
         try:
             # 开始事务
             self.connection.begin()
             
-            with self.connection.cursor() as cursor:
-                for index, sql in enumerate(sql_statements):
-                    if not sql.strip():  # 跳过空语句
-                        continue
-                        
-                    # 替换占位符
-                    processed_sql = sql
-                    if params:
-                        for key, value in params.items():
-                            placeholder = f"{{{{{key}}}}}"
-                            processed_sql = processed_sql.replace(placeholder, str(value))
-                    
-                    # 执行SQL
-                    cursor.execute(processed_sql)
-                    
-                    # 判断SQL类型
-                    sql_upper = processed_sql.strip().upper()
-                    
-                    if sql_upper.startswith('SELECT'):
-                        # SELECT查询返回结果集
-                        query_results = cursor.fetchall()
-                        results.append({
-                            "statement_index": index + 1,
-                            "sql": processed_sql,
-                            "type": "SELECT",
-                            "results": query_results if query_results else [],
-                            "row_count": len(query_results) if query_results else 0
-                        })
-                    else:
-                        # 增删改操作
-                        affected_rows = cursor.rowcount
-                        results.append({
-                            "statement_index": index + 1,
-                            "sql": processed_sql,
-                            "type": "MODIFY",
-                            "affected_rows": affected_rows,
-                            "success": True
-                        })
-                
-                # 提交事务
-                self.connection.commit()
-                return results
+            cursor = self._cursor
+            execute = cursor.execute
+            for statement_index, statement_end, processed_sql in statements:
+                # 执行SQL
+                execute(processed_sql)
                 
+                # 判断SQL类型
+                if _statement_keyword(processed_sql) == 'SELECT':
+                    # SELECT查询返回结果集
+                    query_results = cursor.fetchall()
+                    results.append({
+                        "statement_index": statement_index,
+                        "statement_end": statement_end,
+                        "sql": processed_sql,
+                        "type": "SELECT",
+                        "results": query_results if query_results else [],
+                        "row_count": len(query_results) if query_results else 0
+                    })
+                else:
+                    # 增删改操作
+                    affected_rows = cursor.rowcount
+                    results.append({
+                        "statement_index": statement_index,
+                        "statement_end": statement_end,
+                        "sql": processed_sql,
+                        "type": "MODIFY",
+                        "affected_rows": affected_rows,
+                        "success": True
+                    })
+            
+            # 提交事务
+            self.connection.commit()
+            return results
+            
         except Exception as e:
-            # 回滚事务
+            # 回滚事务，该连接关闭时不再放回连接池
+            self._reusable = False
             if self.connection:
                 self.connection.rollback()
+                self._reset_cursor()
             raise e
             
     def close(self):
-        """关闭数据库连接"""
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        """释放数据库连接（可用的连接归还连接池）"""
+        if not self.connection:
+            return
+            
+        self._close_cursor()
+        conn = self.connection
+        self.connection = None
+        
+        if not self._reusable or self._pool_key not in _POOL:
+            self._discard(conn)
+            return
+            
+        try:
+            # 结束未提交的事务（查询语句也会开启事务），同时检测连接是否可用
+            conn.rollback()
+            _POOL[self._pool_key].put_nowait(conn)
+        except Exception:
+            # 连接已失效或连接池已满
+            self._discard(conn)
+            
+    @staticmethod
+    def _discard(conn):
+        """彻底关闭连接，忽略关闭过程中的异常"""
+        try:
+            conn.close()
+        except Exception:
+            pass
+            
+    @classmethod
+    def close_pool(cls):
+        """关闭连接池中的所有空闲连接（程序退出时调用）"""
+        for pool in _POOL.values():
+            while True:
+                try:
+                    conn = pool.get_nowait()
+                except queue.Empty:
+                    break
+                cls._discard(conn)
+        _POOL.clear()
 
 
 class DatabaseTool(QMainWindow):
@@ -744,9 +1259,29 @@ class DatabaseTool(QMainWindow):
         self.input_widgets = {}
         self.query_groups = []
         self.all_query_groups = []  # 存储所有查询组，用于搜索过滤
+        # 与all_query_groups一一对应的并行列表，搜索时直接按下标访问
+        self._haystacks = []  # 大小写折叠后的搜索文本
+        self._group_boxes = []  # 查询组控件
+        self._visible = []  # 当前是否显示，避免重复调用setVisible
+        self._blob = None  # 所有搜索文本拼接成的字符串，首次搜索时创建
+        self._blob_starts = []  # 每个查询组在_blob中的起始位置
+        self._last_search = ''
+        self._last_visible = []  # 上一次搜索匹配的查询组下标
         self.db_connection = None
-        self.search_timer = QTimer()  # 搜索延迟定时器
+        self._result_buffer = []  # 待写入结果区域的文本行
+        
+        # 配置文件路径在运行期间不会变化，只计算一次（支持打包和开发环境）
+        if getattr(sys, 'frozen', False):
+            # 如果是打包后的exe
+            self._config_path = os.path.dirname(sys.executable)
+        else:
+            # 如果是Python脚本
+            self._config_path = os.path.dirname(os.path.abspath(__file__))
+        self._config_file = os.path.join(self._config_path, 'config.json')
+        
+        self.search_timer = QTimer(self)  # 搜索延迟定时器，合并连续按键
         self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
         self.search_timer.timeout.connect(self.perform_search)
         
         # 初始化界面
@@ -847,15 +1382,19 @@ class DatabaseTool(QMainWindow):
         main_layout.addWidget(left_widget, 1)
         main_layout.addWidget(right_widget, 1)
         
-    def on_search_text_changed(self):
+    def on_search_text_changed(self, text: str):
         """搜索文本改变时的处理"""
-        # 使用定时器延迟搜索，避免频繁触发
-        self.search_timer.stop()
-        self.search_timer.start(300)  # 300ms延迟
+        if not text.strip():
+            # 清空搜索时立即显示全部，无需等待
+            self.search_timer.stop()
+            self.perform_search()
+            return
+        # 使用定时器延迟搜索，连续输入时只在停顿后执行一次
+        self.search_timer.start()
         
     def perform_search(self):
         """执行搜索过滤"""
-        search_text = self.search_input.text().strip().lower()
+        search_text = self.search_input.text().strip().casefold()
         
         if not search_text:
             # 如果搜索框为空，显示所有项
@@ -863,65 +1402,108 @@ class DatabaseTool(QMainWindow):
             self.update_search_stats(len(self.all_query_groups), len(self.all_query_groups))
             return
         
-        visible_count = 0
         total_count = len(self.all_query_groups)
         
-        # 遍历所有查询组进行过滤
-        for group_info in self.all_query_groups:
-            group_box = group_info['group_box']
-            query_config = group_info['query_config']
-            
-            # 检查是否匹配搜索条件
-            is_match = self.is_query_match(query_config, search_text)
-            
-            # 显示或隐藏查询组
-            group_box.setVisible(is_match)
-            if is_match:
-                visible_count += 1
-        
-        # 更新搜索统计
-        self.update_search_stats(visible_count, total_count)
-        
-    def is_query_match(self, query_config: Dict[str, Any], search_text: str) -> bool:
-        """检查查询配置是否匹配搜索条件"""
-        # 搜索查询名称
-        name = query_config.get('name', '').lower()
-        if search_text in name:
-            return True
-        
-        # 搜索查询描述
-        description = query_config.get('description', '').lower()
-        if search_text in description:
-            return True
-        
-        # 搜索气泡描述
-        bubble_description = query_config.get('bubble_description', '').lower()
-        if search_text in bubble_description:
-            return True
+        # 新关键词是上一次关键词的延伸时，上一次未匹配的查询组不可能匹配且已隐藏，
+        # 只需在上一次的匹配结果中继续筛选和切换可见性
+        narrowed = bool(self._last_search) and search_text.startswith(self._last_search)
         
-        # 搜索输入字段标签
-        input_fields = query_config.get('input_fields', [])
-        for field in input_fields:
-            field_label = field.get('label', '').lower()
-            if search_text in field_label:
-                return True
+        if narrowed:
+            index = self._haystacks
+            visible = [i for i in self._last_visible if search_text in index[i]]
+        else:
+            visible = self.blob_search(search_text)
+        matched = set(visible)
+        
+        # 批量切换可见性，只在可见状态变化时调用setVisible，结束时重绘一次。
+        # 上一次未匹配的查询组均已隐藏，只有上次可见或本次匹配的查询组可能需要切换
+        group_boxes = self._group_boxes
+        visible_flags = self._visible
+        container = self.scroll_content
+        container.setUpdatesEnabled(False)
+        try:
+            for i in matched.union(self._last_visible):
+                is_match = i in matched
+                if is_match != visible_flags[i]:
+                    group_boxes[i].setVisible(is_match)
+                    visible_flags[i] = is_match
+        finally:
+            container.setUpdatesEnabled(True)
+            container.update()
+        
+        self._last_search = search_text
+        self._last_visible = visible
         
-        # 搜索SQL语句
+        # 更新搜索统计
+        self.update_search_stats(len(visible), total_count)
+        
+    def build_search_index(self):
+        """根据all_query_groups生成搜索用的并行列表"""
+        groups = self.all_query_groups
+        self._haystacks = [group_info['_haystack'] for group_info in groups]
+        self._group_boxes = [group_info['group_box'] for group_info in groups]
+        self._visible = [True] * len(groups)  # 新创建的查询组均为显示状态
+        self._last_search = ''
+        self._last_visible = list(range(len(self.all_query_groups)))
+        # 拼接文本在第一次搜索时才创建，避免拖慢界面加载
+        self._blob = None
+        self._blob_starts = []
+        
+    def blob_search(self, search_text: str) -> List[int]:
+        """在所有搜索文本拼接成的大字符串中查找关键词，返回匹配的查询组下标（升序）
+
+        每次 find 命中后用二分查找定位所属查询组，再从下一个查询组的起点继续，
+        整个扫描由 str.find 在C层完成，而不是对每个查询组做一次 in 判断。
+        """
+        if self._blob is None:
+            self._blob = '\x00'.join(self._haystacks)
+            # 第i个查询组的文本从 _blob_starts[i] 开始，末尾多一项作为哨兵
+            self._blob_starts = [0]
+            self._blob_starts.extend(accumulate(len(h) + 1 for h in self._haystacks))
+            
+        find = self._blob.find
+        starts = self._blob_starts
+        visible = []
+        pos = find(search_text)
+        while pos >= 0:
+            i = bisect.bisect_right(starts, pos) - 1
+            visible.append(i)
+            pos = find(search_text, starts[i + 1])
+        return visible
+        
+    @staticmethod
+    def search_key(query_config: Dict[str, Any]) -> str:
+        """生成查询配置的大小写折叠（casefold）后的搜索文本"""
+        parts = [
+            query_config.get('name', ''),
+            query_config.get('description', ''),
+            query_config.get('bubble_description', '')
+        ]
+        parts.extend(field.get('label', '') for field in query_config.get('input_fields', []))
         sql = query_config.get('sql', '')
-        if isinstance(sql, str):
-            if search_text in sql.lower():
-                return True
-        elif isinstance(sql, list):
-            for sql_stmt in sql:
-                if search_text in sql_stmt.lower():
-                    return True
-        
-        return False
+        if isinstance(sql, list):
+            parts.extend(sql)
+        elif isinstance(sql, str):
+            parts.append(sql)
+        # 以\x00分隔各字段，搜索关键词不会跨字段匹配
+        return '\x00'.join(parts).casefold()
         
     def show_all_groups(self):
         """显示所有查询组"""
-        for group_info in self.all_query_groups:
-            group_info['group_box'].setVisible(True)
+        container = self.scroll_content
+        container.setUpdatesEnabled(False)
+        try:
+            visible_flags = self._visible
+            for i, group_box in enumerate(self._group_boxes):
+                if not visible_flags[i]:
+                    group_box.setVisible(True)
+                    visible_flags[i] = True
+        finally:
+            container.setUpdatesEnabled(True)
+            container.update()
+            
+        self._last_search = ''
+        self._last_visible = list(range(len(self.all_query_groups)))
             
     def update_search_stats(self, visible_count: int, total_count: int):
         """更新搜索统计信息"""
@@ -1007,21 +1589,20 @@ class DatabaseTool(QMainWindow):
         
     def get_config_path(self):
         """获取配置文件路径（支持打包和开发环境）"""
-        if getattr(sys, 'frozen', False):
-            # 如果是打包后的exe
-            application_path = os.path.dirname(sys.executable)
-        else:
-            # 如果是Python脚本
-            application_path = os.path.dirname(os.path.abspath(__file__))
-        return os.path.join(application_path, 'config.json')
+        return self._config_file
         
     def load_config(self):
         """加载配置文件"""
         config_path = self.get_config_path()
+        self._config_stamp = None  # 加载失败时为None，下次刷新总是重新加载
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                self.config = json.load(f)
+            with open(config_path, 'rb') as f:
+                data = f.read()
+                st = os.fstat(f.fileno())
+            self.config = _json_loads(data)
+            self._config_stamp = (st.st_mtime_ns, st.st_size)
+            self._config_digest = _digest(data)
             self.append_result("✅ 配置文件加载成功")
             self.append_result(f"📁 配置文件路径: {config_path}")
             self.append_result(f"🔍 查询数量: {len(self.config.get('queries', []))}")
@@ -1112,6 +1693,7 @@ class DatabaseTool(QMainWindow):
             self.create_query_group(query_config)
             
         self.scroll_layout.addStretch()
+        self.build_search_index()
         self.append_result("✅ 查询界面创建完成")
         
         # 更新搜索统计
@@ -1136,43 +1718,38 @@ class DatabaseTool(QMainWindow):
             if 'description' in query_config:
                 desc_label.setToolTip(query_config['bubble_description'])
         
-        # 创建输入字段
+        # 创建输入字段，同时记录每个字段的取值函数，执行查询时无需再判断控件类型
         input_widgets = {}
+        getters = {}
         if 'input_fields' in query_config and query_config['input_fields']:
             for field_config in query_config['input_fields']:
-                field_widget = self.create_input_field(field_config)
-                if field_widget:
-                    # 获取实际的输入控件（跳过容器）
-                    actual_widget = field_widget.findChild(QLineEdit) or field_widget.findChild(QSpinBox) or \
-                                   field_widget.findChild(QDoubleSpinBox) or field_widget.findChild(QDateEdit) or \
-                                   field_widget.findChild(QComboBox)
-                    if actual_widget:
-                        input_widgets[field_config['label']] = actual_widget
-                    else:
-                        input_widgets[field_config['label']] = field_widget
-                    group_layout.addWidget(field_widget)
+                field_widget, actual_widget, getter = self.create_input_field(field_config)
+                label = sys.intern(field_config['label'])
+                input_widgets[label] = actual_widget
+                getters[label] = getter
+                group_layout.addWidget(field_widget)
         
         # 添加SQL预览
         sql_group = QWidget()
         sql_layout = QVBoxLayout(sql_group)
         sql_layout.setContentsMargins(0, 5, 0, 5)
         
+        sql_header = QHBoxLayout()
         sql_label = QLabel("SQL语句:")
         sql_label.setStyleSheet("font-weight: bold; margin-top: 5px;")
-        sql_layout.addWidget(sql_label)
-        
-        sql_preview = QTextEdit()
-        sql_preview.setPlainText(query_config.get('sql', ''))
-        sql_preview.setMaximumHeight(80)
-        sql_preview.setReadOnly(True)
-        sql_preview.setStyleSheet("""
-            background-color: #f5f5f5;
-            font-family: Consolas;
-            font-size: 11px;
-            border: 1px solid #ddd;
-            border-radius: 3px;
-        """)
-        sql_layout.addWidget(sql_preview)
+        sql_header.addWidget(sql_label)
+        
+        # 默认只显示SQL摘要，完整的QTextEdit在第一次点击"显示SQL"时才创建
+        sql = query_config.get('sql', '')
+        sql_summary = ElidedLabel(self.sql_summary(sql))
+        sql_summary.setStyleSheet("color: #666; font-family: Consolas; font-size: 11px; margin-top: 5px;")
+        sql_header.addWidget(sql_summary, 1)
+        
+        sql_toggle_btn = QPushButton("显示SQL")
+        sql_toggle_btn.setStyleSheet("padding: 2px 8px; margin-top: 5px;")
+        sql_header.addWidget(sql_toggle_btn)
+        
+        sql_layout.addLayout(sql_header)
         group_layout.addWidget(sql_group)
         
         # 创建执行按钮
@@ -1195,10 +1772,6 @@ class DatabaseTool(QMainWindow):
                 color: #666666;
             }
         """)
-        execute_btn.clicked.connect(
-            lambda: self.execute_query(query_config, input_widgets)
-        )
-        
         group_layout.addWidget(execute_btn)
         
         self.scroll_layout.addWidget(group_box)
@@ -1207,14 +1780,52 @@ class DatabaseTool(QMainWindow):
         group_info = {
             'group_box': group_box,
             'query_config': query_config,
-            'input_widgets': input_widgets
+            'input_widgets': input_widgets,
+            '_getters': list(getters.items()),  # (字段名, 取值函数)，按input_fields顺序
+            '_haystack': self.search_key(query_config),  # casefold后的搜索文本，创建时生成一次
+            'sql_layout': sql_layout,
+            'sql_summary': sql_summary,
+            'sql_toggle_btn': sql_toggle_btn,
+            'sql_preview': None  # 首次展开时创建
         }
+        sql_toggle_btn.clicked.connect(lambda: self.toggle_sql_preview(group_info))
+        execute_btn.clicked.connect(lambda: self.execute_query(group_info))
         
         self.query_groups.append(group_info)
         self.all_query_groups.append(group_info)
         
-    def create_input_field(self, field_config: Dict[str, str]) -> QWidget:
-        """创建单个输入字段"""
+    @staticmethod
+    def sql_summary(sql: str) -> str:
+        """SQL摘要：折叠换行和连续空白为单行，显示时按标签宽度截断"""
+        return ' '.join(sql.split())
+        
+    def toggle_sql_preview(self, group_info: Dict[str, Any]):
+        """展开/收起SQL预览，QTextEdit在第一次展开时创建并缓存到group_info"""
+        sql_preview = group_info['sql_preview']
+        if sql_preview is None:
+            sql_preview = QTextEdit()
+            sql_preview.setPlainText(group_info['query_config'].get('sql', ''))
+            sql_preview.setMaximumHeight(80)
+            sql_preview.setReadOnly(True)
+            sql_preview.setStyleSheet("""
+                background-color: #f5f5f5;
+                font-family: Consolas;
+                font-size: 11px;
+                border: 1px solid #ddd;
+                border-radius: 3px;
+            """)
+            group_info['sql_layout'].addWidget(sql_preview)
+            group_info['sql_preview'] = sql_preview
+            expanded = True
+        else:
+            expanded = not sql_preview.isVisibleTo(group_info['group_box'])
+            sql_preview.setVisible(expanded)
+        
+        group_info['sql_summary'].setVisible(not expanded)
+        group_info['sql_toggle_btn'].setText("隐藏SQL" if expanded else "显示SQL")
+        
+    def create_input_field(self, field_config: Dict[str, str]) -> Tuple[QWidget, QWidget, Callable[[], Any]]:
+        """创建单个输入字段，返回 (容器控件, 实际输入控件, 取值函数)"""
         container = QWidget()
         layout = QHBoxLayout(container)
         layout.setContentsMargins(0, 2, 0, 2)
@@ -1230,12 +1841,14 @@ class DatabaseTool(QMainWindow):
             widget = QLineEdit()
             widget.setPlaceholderText(field_config.get('placeholder', ''))
             widget.setClearButtonEnabled(True)
+            getter = lambda w=widget: w.text().strip()
             
         elif input_type == 'number':
             widget = QSpinBox()
             widget.setMaximum(999999)
             widget.setMinimum(-999999)
             widget.setButtonSymbols(QSpinBox.NoButtons)
+            getter = widget.value
             
         elif input_type == 'float':
             widget = QDoubleSpinBox()
@@ -1243,12 +1856,14 @@ class DatabaseTool(QMainWindow):
             widget.setMinimum(-999999.99)
             widget.setDecimals(2)
             widget.setButtonSymbols(QDoubleSpinBox.NoButtons)
+            getter = widget.value
             
         elif input_type == 'date':
             widget = QDateEdit()
             widget.setCalendarPopup(True)
             widget.setDate(QDate.currentDate())
             widget.setDisplayFormat("yyyy-MM-dd")
+            getter = lambda w=widget: w.date().toString("yyyy-MM-dd")
             
         elif input_type == 'select':
             widget = QComboBox()
@@ -1256,16 +1871,19 @@ class DatabaseTool(QMainWindow):
                 widget.addItems(field_config['options'])
             else:
                 widget.addItems(["选项1", "选项2", "选项3"])
+            getter = widget.currentText
                 
         else:
             widget = QLineEdit()
             widget.setPlaceholderText(field_config.get('placeholder', ''))
+            getter = lambda w=widget: w.text().strip()
         
         layout.addWidget(widget)
-        return container
+        return container, widget, getter
         
-    def execute_query(self, query_config: Dict[str, Any], input_widgets: Dict[str, QWidget]):
+    def execute_query(self, group_info: Dict[str, Any]):
         """执行查询（支持单条或多条SQL语句）"""
+        query_config = group_info['query_config']
         try:
             if not self.db_connection:
                 QMessageBox.warning(self, "警告", "请先连接数据库！")
@@ -1275,31 +1893,8 @@ class DatabaseTool(QMainWindow):
                 QMessageBox.warning(self, "警告", "数据库连接已断开，请重新连接！")
                 return
                 
-            # 收集输入参数
-            values = {}
-            
             # 按照input_fields的顺序收集参数
-            if 'input_fields' in query_config:
-                for field_config in query_config['input_fields']:
-                    label = field_config['label']
-                    if label in input_widgets:
-                        widget = input_widgets[label]
-                        
-                        if isinstance(widget, QLineEdit):
-                            value = widget.text().strip()
-                            values[label] = value
-                        elif isinstance(widget, QSpinBox):
-                            value = widget.value()
-                            values[label] = value
-                        elif isinstance(widget, QDoubleSpinBox):
-                            value = widget.value()
-                            values[label] = value
-                        elif isinstance(widget, QDateEdit):
-                            value = widget.date().toString("yyyy-MM-dd")
-                            values[label] = value
-                        elif isinstance(widget, QComboBox):
-                            value = widget.currentText()
-                            values[label] = value
+            values = {label: getter() for label, getter in group_info['_getters']}
 
             # 获取SQL语句
             original_sql = query_config.get('sql', '')
@@ -1307,44 +1902,38 @@ class DatabaseTool(QMainWindow):
             # 检测是否为多条SQL语句
             sql_statements = []
             if isinstance(original_sql, str):
-                # 按分号分割SQL语句
-                statements = [stmt.strip() for stmt in original_sql.split(';') if stmt.strip()]
-                sql_statements = statements
+                # 按分号分割SQL语句（引号和注释内的分号不作为分隔符）
+                sql_statements = list(_split_sql(original_sql))
             elif isinstance(original_sql, list):
                 # 支持配置为SQL语句列表
                 sql_statements = original_sql
             else:
                 sql_statements = [str(original_sql)]
 
-            # 替换所有{{字段名}}占位符
-            processed_statements = []
-            for sql in sql_statements:
-                processed_sql = sql
-                for label, value in values.items():
-                    placeholder = f"{{{{{label}}}}}"
-                    processed_sql = processed_sql.replace(placeholder, str(value))
-                processed_statements.append(processed_sql)
+            # 替换所有{{字段名}}占位符（参数值只转换一次字符串，每条语句一次扫描）
+            str_values = {label: str(value) for label, value in values.items()}
+            processed_statements = [_render_sql(sql, str_values) for sql in sql_statements]
 
             # 显示执行信息
-            self.append_result("=" * 60)
-            self.append_result(f"🔍 执行查询: {query_config.get('name', '未命名')}")
-            self.append_result(f"⏰ 执行时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            self._queue_result("=" * 60)
+            self._queue_result(f"🔍 执行查询: {query_config.get('name', '未命名')}")
+            self._queue_result(f"⏰ 执行时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
             
             if values:
-                self.append_result("📊 输入参数:")
-                self.append_result(json.dumps(values, ensure_ascii=False, indent=2, default=self.serialize_datetime))
+                self._queue_result("📊 输入参数:")
+                self._queue_result(_RESULT_ENCODER_INDENT.encode(values))
             
             if len(processed_statements) > 1:
-                self.append_result(f"📝 执行 {len(processed_statements)} 条SQL语句:")
+                self._queue_result(f"📝 执行 {len(processed_statements)} 条SQL语句:")
                 for i, sql in enumerate(processed_statements, 1):
-                    self.append_result(f"  {i}. {sql}")
+                    self._queue_result(f"  {i}. {sql}")
             else:
-                self.append_result("📝 原始SQL:")
-                self.append_result(original_sql)
-                self.append_result("🔄 处理后SQL:")
-                self.append_result(processed_statements[0])
+                self._queue_result("📝 原始SQL:")
+                self._queue_result(original_sql)
+                self._queue_result("🔄 处理后SQL:")
+                self._queue_result(processed_statements[0])
             
-            self.append_result("-" * 60)
+            self._queue_result("-" * 60)
 
             # 根据SQL语句数量选择执行方式
             if len(processed_statements) == 1:
@@ -1353,71 +1942,113 @@ class DatabaseTool(QMainWindow):
                 
                 # 显示结果
                 if results:
-                    self.append_result(f"📈 查询结果 ({len(results)} 条记录):")
-                    self.append_result(json.dumps(results, ensure_ascii=False, indent=2, default=self.serialize_datetime))
+                    self._queue_result(f"📈 查询结果 ({len(results)} 条记录):")
+                    self.append_rows(results)
                 else:
-                    self.append_result("📭 查询成功，但没有返回数据")
+                    self._queue_result("📭 查询成功，但没有返回数据")
             else:
                 # 多条SQL执行（事务处理）
-                results = self.db_connection.execute_multiple_queries(processed_statements, values)
+                # 语句已完成占位符替换，不再传入参数重复替换
+                results = self.db_connection.execute_multiple_queries(processed_statements)
                 
                 # 显示结果
-                total_statements = len(results)
+                # 按原始语句计数，合并执行的INSERT计为其覆盖的全部语句
+                total_statements = sum(r["statement_end"] - r["statement_index"] + 1 for r in results)
                 total_affected = 0
                 total_selected = 0
                 
-                self.append_result(f"📊 执行完成 ({total_statements} 条语句):")
+                self._queue_result(f"📊 执行完成 ({total_statements} 条语句):")
                 
                 for result in results:
                     stmt_num = result["statement_index"]
+                    if result["statement_end"] != stmt_num:
+                        stmt_num = f"{stmt_num}-{result['statement_end']}"
                     sql_type = result["type"]
                     
                     if sql_type == "SELECT":
                         row_count = result["row_count"]
                         total_selected += row_count
-                        self.append_result(f"  语句 {stmt_num}: SELECT查询返回 {row_count} 条记录")
+                        self._queue_result(f"  语句 {stmt_num}: SELECT查询返回 {row_count} 条记录")
                         if result["results"]:
-                            self.append_result(json.dumps(result["results"], ensure_ascii=False, indent=2, default=self.serialize_datetime))
+                            self.append_rows(result["results"])
                     else:
                         affected_rows = result["affected_rows"]
                         total_affected += affected_rows
-                        self.append_result(f"  语句 {stmt_num}: 影响 {affected_rows} 行数据")
+                        self._queue_result(f"  语句 {stmt_num}: 影响 {affected_rows} 行数据")
                 
-                self.append_result(f"📈 总计: 影响 {total_affected} 行, 查询 {total_selected} 条记录")
+                self._queue_result(f"📈 总计: 影响 {total_affected} 行, 查询 {total_selected} 条记录")
                 
-            self.append_result("✅ 查询执行完成")
-            self.append_result("=" * 60)
-            self.append_result("")
+            self._queue_result("✅ 查询执行完成")
+            self._queue_result("=" * 60)
+            self._queue_result("")
+            self._flush_result()
             
         except Exception as e:
             error_msg = f"❌ 查询执行失败: {str(e)}"
             self.append_result(error_msg)
             QMessageBox.critical(self, "执行错误", f"查询执行失败:\n{str(e)}")
             
-    def serialize_datetime(self, obj):
-        """序列化datetime对象为字符串"""
-        if isinstance(obj, (datetime, date)):
-            return obj.isoformat()
-        elif hasattr(obj, '__float__'):  # 处理Decimal类型
-            return float(obj)
-        elif hasattr(obj, '__int__'):  # 处理其他数值类型
-            return int(obj)
-        raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+    def append_rows(self, rows: List[Dict[str, Any]]):
+        """显示查询结果记录（每行一条记录，超过 _RESULT_PREVIEW_ROWS 条时截断）"""
+        preview = rows[:_RESULT_PREVIEW_ROWS]
+        self._queue_result('\n'.join(map(_RESULT_ENCODER.encode, preview)))
+        if len(rows) > _RESULT_PREVIEW_ROWS:
+            self._queue_result(f"… 其余 {len(rows) - _RESULT_PREVIEW_ROWS} 条记录未显示")
+        
+    def _queue_result(self, text: str):
+        """暂存一行结果，由 _flush_result 一次性写入结果区域"""
+        self._result_buffer.append(text)
+        
+    def _flush_result(self):
+        """将暂存的结果一次性写入文本区域并滚动到底部"""
+        if not self._result_buffer:
+            return
+        text = '\n'.join(self._result_buffer)
+        self._result_buffer.clear()
         
-    def append_result(self, text: str):
-        """添加结果到文本区域"""
-        self.result_text.append(text)
+        document = self.result_text.document()
+        if not document.isEmpty():
+            text = '\n' + text
+        self.result_text.setUpdatesEnabled(False)
+        try:
+            cursor = QTextCursor(document)
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText(text)
+        finally:
+            self.result_text.setUpdatesEnabled(True)
         self.result_text.verticalScrollBar().setValue(
             self.result_text.verticalScrollBar().maximum()
         )
         
+    def append_result(self, text: str):
+        """添加结果到文本区域（立即显示）"""
+        self._queue_result(text)
+        self._flush_result()
+        
     def clear_results(self):
         """清除结果区域"""
         self.result_text.clear()
         self.append_result("🗑️ 结果已清除")
         
+    def config_unchanged(self) -> bool:
+        """配置文件自上次成功加载后是否未变化（修改时间、大小和内容摘要均相同）"""
+        if self._config_stamp is None:
+            return False
+        try:
+            st = os.stat(self._config_file)
+            if (st.st_mtime_ns, st.st_size) != self._config_stamp:
+                return False
+            # 修改时间精度不足时，时间和大小相同也可能内容已变，再比较内容摘要
+            return _file_digest(self._config_file) == self._config_digest
+        except OSError:
+            return False
+        
     def refresh_config(self):
         """重新加载配置文件"""
+        if self.config_unchanged():
+            self.append_result("✅ 配置未变化，跳过刷新")
+            return
+            
         self.append_result("🔄 开始刷新配置...")
         
         # 清除现有的查询组
@@ -1425,6 +2056,7 @@ class DatabaseTool(QMainWindow):
             group['group_box'].deleteLater()
         self.query_groups.clear()
         self.all_query_groups.clear()
+        self.build_search_index()
         
         # 清空搜索
         self.search_input.clear()
@@ -1501,6 +2133,7 @@ class DatabaseTool(QMainWindow):
         """关闭事件"""
         if self.db_connection:
             self.db_connection.close()
+        DatabaseConnection.close_pool()
         event.accept()
 
 